@@ -1,9 +1,17 @@
 import os
 import logging
-from flask import Flask, request, jsonify
-from werkzeug.utils import secure_filename
+import tempfile
+from flask import Flask, Request, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.middleware.proxy_fix import ProxyFix
-from solver import WordPuzzleSolver
+from solver import get_solver
+
+# Serialize responses with orjson when installed, Flask's stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,18 +23,34 @@ app.secret_key = os.environ.get("SESSION_SECRET", "koyeb-secret-key")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+SPOOL_MAX_SIZE = 4 * 1024 * 1024  # Uploads up to 4MB never touch disk
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
-# Create upload directory if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+class InMemoryUploadRequest(Request):
+    """Request that buffers file uploads in memory up to SPOOL_MAX_SIZE"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Werkzeug's default rolls anything over 500KB to a temporary file on disk
+        return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='rb+')
+
+app.request_class = InMemoryUploadRequest
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson instead of the stdlib encoder"""
 
-# Initialize solver
-solver = WordPuzzleSolver()
+    def dumps(self, obj, **kwargs):
+        # Types orjson does not know go through Flask's default conversions
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+# Initialize the shared solver
+solver = get_solver()
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
@@ -43,8 +67,7 @@ def health():
     """Detailed health check"""
     return jsonify({
         "status": "healthy",
-        "dictionary_size": len(solver.dictionary),
-        "upload_folder": UPLOAD_FOLDER
+        "dictionary_size": solver.dictionary_size
     })
 
 @app.route('/solve', methods=['POST'])
@@ -65,21 +88,15 @@ def solve_puzzle():
         if not allowed_file(file.filename):
             return jsonify({'error': 'File type not allowed'}), 400
 
-        # Save uploaded file
-        filename = secure_filename(file.filename or 'image.jpg')
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Read the upload into memory and decode it there, no temporary file
+        data = file.read()
+        if not data:
+            return jsonify({'error': 'Empty file'}), 400
 
-        logger.info(f"Processing image: {filepath}")
+        logger.info(f"Processing image: {file.filename} ({len(data)} bytes)")
 
         # Process the image and solve the puzzle
-        result = solver.solve_puzzle(filepath)
-
-        # Clean up uploaded file
-        try:
-            os.remove(filepath)
-        except Exception as e:
-            logger.warning(f"Failed to remove temporary file: {e}")
+        result = solver.solve_puzzle_bytes(data)
 
         return jsonify(result)
 
@@ -1,9 +1,14 @@
+import hashlib
+import io
 import os
 import logging
 import requests
 import time
-import itertools
-from PIL import Image, ImageFilter, ImageEnhance
+import threading
+import pickle
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageFilter, ImageStat
 import pytesseract
 
 # Try to import OpenCV, but use PIL fallback if it fails
@@ -15,51 +20,583 @@ except ImportError as e:
     logging.warning(f"OpenCV not available: {e}. Using PIL fallback.")
     OPENCV_AVAILABLE = False
 
+# Prefer an in-process Tesseract handle over pytesseract's per-call subprocess
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    TESSEROCR_AVAILABLE = True
+except ImportError as e:
+    logging.warning(f"tesserocr not available: {e}. Using pytesseract subprocess OCR.")
+    TESSEROCR_AVAILABLE = False
+
+# Numba JIT for the per-contour filter loop, NumPy vectorization otherwise
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+LETTER_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Tesseract configs, built once: single word, letter mosaic, and full-page scan; the
+# scan uses sparse-text mode since board letters are scattered, not a block of lines
+TESS_CONFIG = f'--psm 8 -c tessedit_char_whitelist={LETTER_WHITELIST}'
+TESS_MOSAIC_CONFIG = f'--psm 6 -c tessedit_char_whitelist={LETTER_WHITELIST}'
+TESS_SCAN_CONFIG = f'--psm 11 -c tessedit_char_whitelist={LETTER_WHITELIST}'
+
+# Minimum Tesseract confidence for a letter read from the mosaic
+MOSAIC_MIN_CONFIDENCE = 60
+
+# Word lengths considered when generating swipes
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 7
+
+# Words returned per puzzle, best first, to avoid overwhelming the response
+MAX_RESULTS = 20
+
+def _parse_hsv_range(value):
+    """Parse 'LO_H,LO_S,LO_V,HI_H,HI_S,HI_V' into (lower, upper) bounds for cv2.inRange"""
+    if not value:
+        return None
+    try:
+        bounds = [int(v) for v in value.split(',')]
+        if len(bounds) != 6:
+            raise ValueError("expected 6 comma-separated values")
+        return tuple(bounds[:3]), tuple(bounds[3:])
+    except ValueError as e:
+        logging.warning(f"Ignoring invalid WHEEL_HSV_RANGE '{value}': {e}")
+        return None
+
+# Optional HSV colour band of the letter wheel, e.g. "0,0,200,180,40,255" for a white disk
+WHEEL_HSV_RANGE = _parse_hsv_range(os.environ.get('WHEEL_HSV_RANGE'))
+
+# Images wider than this are downsampled before circle/contour detection
+WORK_WIDTH = 720
+
+# Read size for the streamed dictionary download; iter_lines defaults to 512 bytes
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Number of solved uploads remembered by image content hash
+RESULT_CACHE_SIZE = 512
+
+# Number of boards whose top words are remembered by their sorted letters
+WORD_CACHE_SIZE = 1024
+
+# Threads that start the grid strategy alongside the wheel, one per concurrent request
+# (the Procfile runs 4 gthread threads per worker); a request finding them all busy runs
+# the grid inline after the wheel, as before
+STRATEGY_WORKERS = int(os.environ.get('STRATEGY_WORKERS', 4))
+
+# Letter mosaic layout for batched OCR: glyph size and whitespace around each glyph
+MOSAIC_CELL = 40
+MOSAIC_PAD = 20
+
+# Recognized glyphs remembered across strategies and images, keyed by glyph_hash
+OCR_CACHE_SIZE = 4096
+GLYPH_HASH_SIZE = 16
+
+# Reference glyphs of recognized letters; an unseen crop this close to one (normalized
+# cross-correlation) is taken as the same letter without running Tesseract
+TEMPLATE_SIZE = 32
+TEMPLATE_MIN_SCORE = 0.92
+TEMPLATE_LIMIT = 512
+# A template answers every later matching crop, so only learn from reads Tesseract is sure of
+TEMPLATE_MIN_CONFIDENCE = 90
+
+# Common English words used when the online dictionary cannot be downloaded
+FALLBACK_WORDS = frozenset("""
+THE AND FOR ARE BUT NOT YOU ALL CAN HAD HER WAS ONE OUR OUT DAY GET HAS HIM HIS HOW ITS MAY NEW
+NOW OLD SEE TWO WHO BOY DID LET PUT SAY SHE TOO USE WAY WHO OIL SIT SET
+ACE ACT ADD AGE AID AIM AIR ARM ART ASK ATE BAD BAG BAR BAT BED BEE BET BIG BIT BOX BUY CAR CAT
+COW CRY CUP CUT DOG EAR EAT EGG END EYE FAR FEW FLY FOR FUN GOT GUN GUY HAT HIT HOT JOB LAW LAY
+LEG LET LIE LOT LOW MAN MAP NET PAY PEN PET PIG POT RAT RED RUN SAD SAT SEA SIT SIX SKY SUN TAX
+TEA TEN TOP TRY VAN WAR WET WIN YES YET ZOO
+FAT FIT FIX FOG FOX FUR GAP GAS GEL GEM GOD ICE ILL INK JAM JAW JOG JOT JOY KEY KID KIT LAB LAG
+LIT LOG MAD MIX MOB MUD NUT ODD ORB OWL OWN PAD PAN PAR PAW PIN PIT PLY POD PRO PUB PUN PUP RAG
+RAM RAP RAW RAY RIB RID RIM RIP ROB ROD ROT ROW RUB RUG RUM RUT SAP SAW SIN SIP SIR SOB SOD SON
+SOP SOW SOY SPA SPY STY TAB TAG TAN TAP TAR TAT TIC TIE TIN TIP TOE TON TOT TOW TOY TUB TUG TUT
+URN VIA VIE VOW WAD WAG WAN WAX WEB WED WEE WIG WIT WOE WOK WON WOO WOW YAK YAM YAP YAW YEA YEN
+YEP YEW YIN YIP YON ZAP ZED ZEE ZEN ZIP ZIT
+ABLE AREA ARMY BABY BACK BALL BAND BANK BASE BATH BEAR BEAT BEEN BELL BEST BILL BIRD BLOW BLUE
+BOAT BODY BONE BOOK BORN BOTH BOYS BUSY CALL CAME CAMP CARD CARE CARS CASE CASH CELL CITY CLUB
+COAL COAT COLD COME COOK COOL COPY CORN COST CREW DARK DATA DATE DAYS DEAD DEAL DEAR DEEP DESK
+DOES DONE DOOR DOWN DRAW DREW DROP DRUG EACH EARN EAST EASY EDGE ELSE EVEN EVER FACE FACT FAIL
+FAIR FALL FARM FAST FEAR FEEL FEET FELL FELT FILE FILL FILM FIND FINE FIRE FIRM FISH FIVE FLAT
+FLOW FOOD FOOT FORM FOUR FREE FROM FULL FUND GAME GAVE GIRL GIVE GLAD GOES GOLD GONE GOOD GREW
+GROW HAIR HALF HALL HAND HARD HARM HEAD HEAR HEAT HELD HELP HERE HIGH HILL HOLD HOME HOPE HOUR
+HUGE IDEA INTO ITEM JOBS JOIN JUMP JUST KEEP KEPT KIND KING KNEW KNOW LAND LAST LATE LEAD LEFT
+LESS LIFE LIKE LINE LIST LIVE LOAN LONG LOOK LORD LOSE LOSS LOST LOVE MADE MAIL MAIN MAKE MALE
+MANY MARK MASS MEAT MEET MIND MINE MISS MODE MORE MOST MOVE MUCH MUST NAME NEAR NECK NEED NEWS
+NEXT NICE NINE NODE NONE NOON NOTE OPEN ORAL OVER PAGE PAID PAIN PAIR PARK PART PASS PAST PATH
+PEAK PICK PINK PLAN PLAY PLOT PLUS POLL POOL POOR PORT POST PULL PURE PUSH RACE RAIN RANK RATE
+READ REAL REAR RELY REST RICH RIDE RING RISE RISK ROAD ROCK ROLE ROLL ROOM ROOT ROSE RULE RUNS
+SAFE SAID SALE SAME SAVE SEAT SEEM SELF SELL SEND SENT SHIP SHOP SHOT SHOW SICK SIDE SIGN SITE
+SIZE SKIN SLIP SLOW SNOW SOFT SOIL SOLD SOME SONG SOON SORT SOUL SPOT STAR STAY STEP STOP SUCH
+SURE TAKE TALK TALL TANK TAPE TASK TEAM TELL TERM TEST TEXT THAN THAT THEN THEY THIN THIS TIME
+TOLD TONE TOOK TOOL TOUR TOWN TREE TRUE TURN TYPE UNIT UPON USED USER VARY VAST VERY VIEW VOTE
+WAGE WAIT WAKE WALK WALL WANT WARD WARM WASH WAVE WAYS WEAK WEAR WEEK WELL WENT WERE WEST WHAT
+WHEN WIDE WIFE WILD WILL WIND WINE WING WIRE WISE WISH WITH WOOD WORD WORE WORK YARD YEAH YEAR
+YOUR ZERO ZONE
+ABOUT ABOVE ABUSE ACTOR ACUTE ADMIT ADOPT ADULT AFTER AGAIN AGENT AGREE AHEAD ALARM ALBUM ALERT
+ALIEN ALIGN ALIKE ALIVE ALLOW ALONE ALONG ALTER ANGLE ANGRY APART APPLE APPLY ARENA ARGUE ARISE
+ARRAY ASIDE ASSET AVOID AWAKE AWARD AWARE BADLY BASIC BEACH BEGAN BEGIN BEING BENCH BIRTH BLACK
+BLAME BLANK BLIND BLOCK BLOOD BOARD BOOST BOOTH BOUND BRAIN BRAND BREAD BREAK BREED BRIEF BRING
+BROAD BROKE BROWN BUILD BUILT CATCH CAUSE CHAIN CHAIR CHAOS CHARM CHART CHASE CHEAP CHECK CHEST
+CHIEF CHILD CHINA CHOSE CIVIL CLAIM CLASS CLEAN CLEAR CLICK CLIMB CLOCK CLOSE CLOUD COACH COAST
+COULD COUNT COURT COVER CRAFT CRASH CRAZY CREAM CRIME CROSS CROWD CROWN CRUDE CURVE CYCLE DAILY
+DANCE DATED DEALT DEATH DEBUT DELAY DEPTH DOING DOUBT DOZEN DRAFT DRAMA DRANK DREAM DRESS DRILL
+DRINK DRIVE DROVE DYING EAGER EARLY EARTH EIGHT ELITE EMPTY ENEMY ENJOY ENTER ENTRY EQUAL ERROR
+EVENT EVERY EXACT EXIST EXTRA FAITH FALSE FAULT FIELD FIFTH FIFTY FIGHT FINAL FIRST FIXED FLASH
+FLEET FLOOR FLUID FOCUS FORCE FORTH FORTY FORUM FOUND FRAME FRANK FRAUD FRESH FRONT FRUIT FULLY
+FUNNY GIANT GIVEN GLASS GLOBE GOING GRACE GRADE GRAND GRANT GRASS GRAVE GREAT GREEN GROSS GROUP
+GROWN GUARD GUESS GUEST GUIDE HAPPY HARSH HEART HEAVY HENCE HORSE HOTEL HOUSE HUMAN IDEAL IMAGE
+INDEX INNER INPUT ISSUE JAPAN JOINT JUDGE KNOWN LABEL LARGE LASER LATER LAUGH LAYER LEARN LEASE
+LEAST LEAVE LEGAL LEVEL LIGHT LIMIT LINKS LIVES LOCAL LOOSE LOWER LUCKY LUNCH LYING MAGIC MAJOR
+MAKER MARCH MATCH MAYBE MAYOR MEANT MEDIA METAL MIGHT MINOR MINUS MIXED MODEL MONEY MONTH MORAL
+MOTOR MOUNT MOUSE MOUTH MOVED MOVIE MUSIC NEEDS NEVER NEWLY NIGHT NOISE NORTH NOTED NOVEL NURSE
+OCCUR OCEAN OFFER OFTEN ORDER OTHER OUGHT PAINT PANEL PAPER PARTY PEACE PHASE PHONE PHOTO PIANO
+PIECE PILOT PITCH PLACE PLAIN PLANE PLANT PLATE POINT POUND POWER PRESS PRICE PRIDE PRIME PRINT
+PRIOR PRIZE PROOF PROUD PROVE QUEEN QUICK QUIET QUITE RADIO RAISE RANGE RAPID RATIO REACH READY
+REALM REBEL REFER RELAX RELAY REPLY RIGHT RIGID RIVAL RIVER ROBOT ROMAN ROUGH ROUND ROUTE ROYAL
+RURAL SCALE SCENE SCOPE SCORE SENSE SERVE SEVEN SHALL SHAPE SHARE SHARP SHEET SHELF SHELL SHIFT
+SHINE SHIRT SHOCK SHOOT SHORT SHOWN SIDES SIGHT SILLY SINCE SIXTH SIXTY SIZED SKILL SLEEP SLIDE
+SMALL SMART SMILE SMITH SMOKE SOLID SOLVE SORRY SOUND SOUTH SPACE SPARE SPEAK SPEED SPEND SPENT
+SPLIT SPOKE SPORT STAFF STAGE STAKE STAND START STATE STEAM STEEL STEEP STEER STICK STILL STOCK
+STONE STOOD STORE STORM STORY STRIP STUCK STUDY STUFF STYLE SUGAR SUITE SUPER SWEET SWIFT SWING
+SWISS TABLE TAKEN TASTE TAXES TEACH TEENS TEETH TEMPO TERMS TEXAS THANK THEFT THEIR THEME THERE
+THESE THICK THING THINK THIRD THOSE THREE THREW THROW THUMB TIGER TIGHT TIMER TIRED TITLE TODAY
+TOPIC TOTAL TOUCH TOUGH TOWER TRACK TRADE TRAIL TRAIN TREAT TREND TRIAL TRIBE TRICK TRIED TRIES
+TRUCK TRULY TRUNK TRUST TRUTH TWICE TWIST ULTRA UNCLE UNDER UNDUE UNION UNITY UNTIL UPPER UPSET
+URBAN USAGE USUAL VALID VALUE VIDEO VIRUS VISIT VITAL VOCAL VOICE WASTE WATCH WATER WHEEL WHERE
+WHICH WHILE WHITE WHOLE WHOSE WOMAN WOMEN WORLD WORRY WORSE WORST WORTH WOULD WRITE WRONG WROTE
+YOUNG YOUTH
+PART TRAP RAPT TARP PRAT ART RAT PAT TAR TAP
+""".split())
+
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def filter_contours(areas, rects, min_area, max_area, min_wh, max_wh, min_ar, max_ar):
+        """Mask contours whose area, bounding box size and aspect ratio look like a letter"""
+        mask = np.zeros(rects.shape[0], np.bool_)
+        for i in range(rects.shape[0]):
+            w = rects[i, 2]
+            h = rects[i, 3]
+            if h == 0:
+                continue
+            aspect_ratio = w / h
+            mask[i] = (min_area < areas[i] < max_area and
+                       min_wh <= w <= max_wh and min_wh <= h <= max_wh and
+                       min_ar < aspect_ratio < max_ar)
+        return mask
+else:
+    def filter_contours(areas, rects, min_area, max_area, min_wh, max_wh, min_ar, max_ar):
+        """Mask contours whose area, bounding box size and aspect ratio look like a letter"""
+        w = rects[:, 2]
+        h = rects[:, 3]
+        aspect_ratio = w / np.maximum(h, 1)
+        return ((areas > min_area) & (areas < max_area) &
+                (w >= min_wh) & (w <= max_wh) & (h >= min_wh) & (h <= max_wh) &
+                (aspect_ratio > min_ar) & (aspect_ratio < max_ar) & (h > 0))
+
+def component_stats(binary):
+    """Pixel areas and bounding rects of the white blobs in a binary image, for filter_contours"""
+    # One labelling pass yields every blob's box and area, no per-contour OpenCV calls
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    # Row 0 is the background
+    areas = stats[1:, cv2.CC_STAT_AREA].astype(np.float64)
+    rects = np.ascontiguousarray(stats[1:, :cv2.CC_STAT_AREA])
+    return areas, rects
+
+def contrast_table(gray, factor, threshold=None):
+    """Lookup table for ImageEnhance.Contrast(gray).enhance(factor), optionally thresholded"""
+    # Contrast scales every level away from the mean grey, so it is a per-level map
+    mean = int(ImageStat.Stat(gray).mean[0] + 0.5)
+    levels = [min(255, max(0, int(mean + factor * (v - mean)))) for v in range(256)]
+    if threshold is None:
+        return levels
+    return [255 if v > threshold else 0 for v in levels]
+
+def glyph_hash(roi):
+    """Scale-free key for a binary letter region: a 16x16 bit thumbnail plus its aspect ratio"""
+    h, w = roi.shape[:2]
+    thumb = cv2.resize(roi, (GLYPH_HASH_SIZE, GLYPH_HASH_SIZE), interpolation=cv2.INTER_AREA)
+    # Squashing to a square hides narrow vs wide glyphs, so keep a coarse aspect bucket
+    return bytes([min(255, round(4 * w / h))]) + np.packbits(thumb > 127).tobytes()
+
+def glyph_template(roi):
+    """(aspect bucket, zero-mean unit-norm 32x32 thumbnail) of the glyph in a letter region, None if blank"""
+    # Crop to the glyph itself: the black padding the strategies add is shared by every
+    # letter and pushes the correlation of look-alikes such as O/D/G/Q over the threshold
+    x, y, w, h = cv2.boundingRect(roi)
+    if w == 0 or h == 0:
+        return None
+    thumb = cv2.resize(roi[y:y+h, x:x+w], (TEMPLATE_SIZE, TEMPLATE_SIZE), interpolation=cv2.INTER_AREA)
+    vector = thumb.astype(np.float32).ravel()
+    vector -= vector.mean()
+    norm = np.linalg.norm(vector)
+    if not norm:
+        return None
+    # Squashing to a square hides narrow vs wide glyphs, so keep a coarse aspect bucket
+    return min(255, round(4 * w / h)), vector / norm
+
+def walk_anagram_dawg(node, letters, counts, start, prefix, max_length, keys):
+    """Collect the anagram keys below node spelled from the sorted board letters and counts"""
+    # Keys are sorted, so only letters from the current one onwards can extend the prefix
+    for i in range(start, len(letters)):
+        if not counts[i]:
+            continue
+        char = letters[i]
+        child = node.get(char)
+        if child is None:
+            continue
+        
+        # Shared nodes carry no key, the path walked so far spells it
+        key = prefix + char
+        if '' in child:
+            keys.append(key)
+        if len(key) < max_length:
+            counts[i] -= 1
+            walk_anagram_dawg(child, letters, counts, i, key, max_length, keys)
+            counts[i] += 1
+
+def assemble_paths(words, letter_positions):
+    """Return (word, slots) for each word that can be traced over the board slots"""
+    results = []
+    for word in words:
+        slots = []
+        # Slots of a letter are consumed in order, so a count per letter is enough
+        used_count = {}
+        for letter in word:
+            letter_slots = letter_positions.get(letter, ())
+            i = used_count.get(letter, 0)
+            if i >= len(letter_slots):
+                # Letter not available, invalid word
+                slots = None
+                break
+            
+            used_count[letter] = i + 1
+            slots.append(letter_slots[i])
+        
+        if slots:
+            results.append((word, tuple(slots)))
+    return results
+
+# Compile the filter at import so no request pays the JIT warm-up
+if NUMBA_AVAILABLE and OPENCV_AVAILABLE:
+    filter_contours(np.zeros(1, np.float64), np.ones((1, 4), np.int32),
+                    -1.0, np.inf, 0.0, np.inf, 0.0, np.inf)
+
 class WordPuzzleSolver:
     def __init__(self):
-        self.dictionary = self._load_dictionary()
-        self.tesseract_config = '--psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        logger.info(f"Solver initialized with {len(self.dictionary)} words")
+        words = self._load_dictionary()
+        self.anagrams = self._build_anagram_index(words)
+        self.anagram_dawg = self._build_anagram_dawg(self.anagrams)
+        # Only the indexes are used for solving; keep just the word count for reporting
+        self.dictionary_size = len(words)
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_apis_lock = threading.Lock()
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+        self._word_cache = OrderedDict()
+        self._word_cache_lock = threading.Lock()
+        # Template rows, their aspect buckets and letters, guarded by the OCR cache lock
+        self._templates = np.empty((0, TEMPLATE_SIZE * TEMPLATE_SIZE), np.float32) if OPENCV_AVAILABLE else None
+        self._template_aspects = np.empty(0, np.uint8) if OPENCV_AVAILABLE else None
+        self._template_letters = []
+        # Created on first detection, and again after close()
+        self._strategy_pool_lock = threading.Lock()
+        self._strategy_pool = None
+        logger.info(f"Solver initialized with {self.dictionary_size} words")
+
+    @property
+    def tess(self):
+        """Tesserocr handle for the calling thread (the Tesseract API is not thread-safe)"""
+        if not hasattr(self._tess_local, 'api'):
+            self._tess_local.api = self._init_tesseract_api()
+        return self._tess_local.api
+
+    def _init_tesseract_api(self):
+        """Create a persistent tesserocr handle configured for single-letter OCR"""
+        if not TESSEROCR_AVAILABLE:
+            return None
+
+        try:
+            api = PyTessBaseAPI(psm=PSM.SINGLE_CHAR, oem=OEM.LSTM_ONLY)
+            api.SetVariable('tessedit_char_whitelist', LETTER_WHITELIST)
+            with self._tess_apis_lock:
+                self._tess_apis.append(api)
+            logger.info("Using in-process tesserocr API for letter OCR")
+            return api
+        except Exception as e:
+            logger.warning(f"Failed to initialize tesserocr: {e}. Using pytesseract subprocess OCR.")
+            return None
+
+    @property
+    def strategy_pool(self):
+        """Thread pool for speculative detection, started on first use"""
+        with self._strategy_pool_lock:
+            if self._strategy_pool is None:
+                self._strategy_pool = ThreadPoolExecutor(max_workers=STRATEGY_WORKERS,
+                                                         thread_name_prefix='detect')
+            return self._strategy_pool
+
+    def close(self):
+        """Stop the strategy threads and release every thread's tesserocr handle"""
+        # The solver stays usable: a later detection starts a fresh pool
+        with self._strategy_pool_lock:
+            pool, self._strategy_pool = self._strategy_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        with self._tess_apis_lock:
+            apis, self._tess_apis = self._tess_apis, []
+            # Any later OCR call starts from a fresh handle
+            self._tess_local = threading.local()
+        for api in apis:
+            try:
+                api.End()
+            except Exception as e:
+                logger.warning(f"Failed to release tesserocr API: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        # __init__ may have failed before the pool and handle list existed
+        if getattr(self, '_strategy_pool', None) is not None or getattr(self, '_tess_apis', None):
+            self.close()
+
+    def _ocr_letter(self, roi):
+        """OCR a single binary letter region as (text, confidence), reusing the tesserocr handle when available"""
+        api = self.tess
+        if api is not None:
+            # Upscale tiny crops so Tesseract sees a readable glyph, keeping them binary
+            if roi.shape[0] < 20:
+                factor = 40 / roi.shape[0]
+                roi = cv2.resize(roi, None, fx=factor, fy=factor, interpolation=cv2.INTER_NEAREST)
+            
+            # ROIs are white-on-black masks; pack them as 1 bpp where a set bit is white
+            # background, so Tesseract gets dark text and skips its own thresholding
+            h, w = roi.shape[:2]
+            packed = np.packbits(roi < 128, axis=1)
+            api.SetImageBytes(packed.tobytes(), w, h, 0, packed.shape[1])
+            text = api.GetUTF8Text().strip()
+            return text, api.MeanTextConf()
+
+        # image_to_string reports no confidence, so these reads never become templates
+        return pytesseract.image_to_string(roi, config=TESS_CONFIG).strip(), 0
+
+    def _ocr_word(self, img):
+        """OCR a PIL image as a single word, reusing the tesserocr handle when available"""
+        api = self.tess
+        if api is not None:
+            # The handle is kept in single-char mode for letter crops; switch only for this call
+            api.SetPageSegMode(PSM.SINGLE_WORD)
+            try:
+                api.SetImage(img)
+                return api.GetUTF8Text().strip()
+            finally:
+                api.SetPageSegMode(PSM.SINGLE_CHAR)
+
+        return pytesseract.image_to_string(img, config=TESS_CONFIG).strip()
+
+    def _ocr_letters(self, rois):
+        """OCR a batch of letter regions, returning one string per region"""
+        if not rois:
+            return []
+
+        # Strategies re-examine the same glyphs, so only OCR crops not seen before
+        keys = [glyph_hash(roi) for roi in rois]
+        texts = [None] * len(rois)
+        with self._ocr_cache_lock:
+            for i, key in enumerate(keys):
+                if key in self._ocr_cache:
+                    self._ocr_cache.move_to_end(key)
+                    texts[i] = self._ocr_cache[key]
+        unseen = [i for i, text in enumerate(texts) if text is None]
+        if not unseen:
+            return texts
+
+        # The app draws every letter in one font, so a new crop usually matches a known glyph
+        glyphs = {i: glyph_template(rois[i]) for i in unseen}
+        self._match_templates(unseen, glyphs, texts)
+        missing = [i for i in unseen if texts[i] is None]
+
+        # In-process calls are cheap, so keep the more accurate single-char mode
+        if not missing:
+            found = []
+        elif self.tess is not None:
+            found = [self._ocr_letter(rois[i]) for i in missing]
+        else:
+            # Otherwise amortize the subprocess cost over a single Tesseract run
+            found = self._ocr_letters_mosaic([rois[i] for i in missing])
+
+        with self._ocr_cache_lock:
+            for i, (text, _) in zip(missing, found):
+                texts[i] = text
+            for i in unseen:
+                self._ocr_cache[keys[i]] = texts[i]
+            while len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+
+            # Keep the glyphs Tesseract confidently read as a single letter as new templates
+            for i, (text, confidence) in zip(missing, found):
+                if (glyphs[i] is not None and len(text) == 1 and text.isalpha() and
+                        confidence >= TEMPLATE_MIN_CONFIDENCE):
+                    self._learn_template(*glyphs[i], text)
+
+        return texts
+
+    def _learn_template(self, aspect, vector, letter):
+        """Add a recognized glyph as a template unless it is too close to another letter's"""
+        # Caller holds the OCR cache lock
+        scores = self._templates @ vector
+        scores[self._template_aspects != aspect] = -1.0
+        close = scores >= TEMPLATE_MIN_SCORE
+        others = np.array([known != letter for known in self._template_letters], bool)
+        if np.any(close & others):
+            # Look-alike letters in this font: forget both, Tesseract has to tell them apart
+            keep = ~(close & others)
+            self._templates = self._templates[keep]
+            self._template_aspects = self._template_aspects[keep]
+            self._template_letters = [known for known, kept in zip(self._template_letters, keep) if kept]
+            return
+        if np.any(close):
+            # An equivalent template of this letter is already known
+            return
+
+        self._templates = np.vstack([self._templates, vector])[-TEMPLATE_LIMIT:]
+        self._template_aspects = np.append(self._template_aspects, np.uint8(aspect))[-TEMPLATE_LIMIT:]
+        self._template_letters = (self._template_letters + [letter])[-TEMPLATE_LIMIT:]
+
+    def _match_templates(self, indices, glyphs, texts):
+        """Fill texts[i] for the crops whose glyph matches templates of exactly one letter"""
+        queries = [i for i in indices if glyphs[i] is not None]
+        if not queries:
+            return
+
+        with self._ocr_cache_lock:
+            templates, aspects, letters = self._templates, self._template_aspects, self._template_letters
+        if not letters:
+            return
+
+        # Unit-norm, zero-mean rows make one matrix product the NCC of every crop/template pair
+        scores = np.stack([glyphs[i][1] for i in queries]) @ templates.T
+        # Only compare glyphs in the same aspect bucket
+        query_aspects = np.array([glyphs[i][0] for i in queries], np.uint8)
+        scores[query_aspects[:, None] != aspects[None, :]] = -1.0
+
+        for i, row in zip(queries, scores >= TEMPLATE_MIN_SCORE):
+            # A crop close to templates of two different letters is ambiguous, leave it to OCR
+            matched = {letters[j] for j in np.flatnonzero(row).tolist()}
+            if len(matched) == 1:
+                texts[i] = matched.pop()
+
+    def _ocr_letters_mosaic(self, rois):
+        """Tile letter regions into one white strip and OCR them with a single Tesseract call,
+        returning (text, confidence) per region"""
+        pitch = MOSAIC_CELL + 2 * MOSAIC_PAD
+        mosaic = np.full((pitch, pitch * len(rois)), 255, np.uint8)
+
+        for i, roi in enumerate(rois):
+            # Fit the glyph into its cell while keeping the aspect ratio
+            rh, rw = roi.shape[:2]
+            scale = MOSAIC_CELL / max(rh, rw)
+            gw, gh = max(1, int(rw * scale)), max(1, int(rh * scale))
+            glyph = cv2.resize(roi, (gw, gh), interpolation=cv2.INTER_AREA)
+
+            # ROIs are white-on-black (THRESH_BINARY_INV); Tesseract wants dark text on white
+            x0 = i * pitch + (pitch - gw) // 2
+            y0 = (pitch - gh) // 2
+            mosaic[y0:y0 + gh, x0:x0 + gw] = 255 - glyph
+
+        data = pytesseract.image_to_data(mosaic, config=TESS_MOSAIC_CONFIG,
+                                         output_type=pytesseract.Output.DICT)
+
+        # Map confident characters back to their cells by horizontal position
+        letters = [('', 0)] * len(rois)
+        for i, text in enumerate(data['text']):
+            text = text.strip()
+            confidence = float(data['conf'][i])
+            if not text or confidence <= MOSAIC_MIN_CONFIDENCE:
+                continue
+
+            # Tesseract may merge neighbouring cells into one word, so split its box evenly
+            char_w = data['width'][i] / len(text)
+            for j, char in enumerate(text):
+                idx = int(data['left'][i] + (j + 0.5) * char_w) // pitch
+                if 0 <= idx < len(rois) and not letters[idx][0]:
+                    letters[idx] = (char, confidence)
+
+        return letters
+
+    def _ocr_candidates(self, candidates, confidence):
+        """OCR (roi, x, y) candidates in one batch and keep single-letter results"""
+        texts = self._ocr_letters([roi for roi, _, _ in candidates])
+
+        letters = []
+        for (_, x, y), letter in zip(candidates, texts):
+            if letter and letter.isalpha() and len(letter) == 1:
+                letters.append({
+                    'letter': letter.upper(),
+                    'x': x,
+                    'y': y,
+                    'confidence': confidence
+                })
+
+        return letters
 
     def _load_dictionary(self):
         """Load comprehensive English dictionary from online source"""
-        # Try to load from cache first
-        cache_file = "english_words_cache.txt"
+        # Try to load from cache first, a pickled frozenset skips per-line parsing
+        cache_file = "english_words_cache.pickle"
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    words = set(word.strip().upper() for word in f.readlines() if word.strip())
+                with open(cache_file, 'rb') as f:
+                    words = pickle.load(f)
                 logger.info(f"Loaded {len(words)} words from cache")
                 return words
             except Exception as e:
                 logger.warning(f"Failed to load cache: {e}")
 
+        # Convert a text cache left by older versions instead of downloading again
+        legacy_cache_file = "english_words_cache.txt"
+        if os.path.exists(legacy_cache_file):
+            try:
+                with open(legacy_cache_file, 'r', encoding='utf-8') as f:
+                    words = frozenset(word.strip().upper() for word in f if word.strip())
+                self._save_dictionary_cache(cache_file, words)
+                logger.info(f"Loaded {len(words)} words from text cache")
+                return words
+            except Exception as e:
+                logger.warning(f"Failed to load text cache: {e}")
+
         # Download comprehensive word list from GitHub
         try:
             logger.info("Downloading comprehensive English dictionary...")
             url = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
-            # Set timeout for production environment
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            # Process word list
-            words_text = response.text
-            words = set()
-            for word in words_text.strip().split('\n'):
-                word = word.strip().upper()
-                if word and len(word) >= 2 and word.isalpha():  # Filter valid words
-                    words.add(word)
+            # Set timeout for production environment; stream so the 4 MB body is never
+            # held as one string plus a list of every line
+            with requests.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                response.encoding = response.encoding or 'utf-8'
+
+                # Process word list line by line as it arrives
+                words = set()
+                for word in response.iter_lines(chunk_size=DOWNLOAD_CHUNK_SIZE, decode_unicode=True):
+                    word = word.strip().upper()
+                    if word and len(word) >= 2 and word.isalpha():  # Filter valid words
+                        words.add(word)
 
             # Cache the downloaded words
-            try:
-                with open(cache_file, 'w', encoding='utf-8') as f:
-                    for word in sorted(words):
-                        f.write(word + '\n')
-                logger.info(f"Cached {len(words)} words to {cache_file}")
-            except Exception as e:
-                logger.warning(f"Failed to cache words: {e}")
+            words = frozenset(words)
+            self._save_dictionary_cache(cache_file, words)
 
             logger.info(f"Downloaded {len(words)} words from online source")
             return words
@@ -70,26 +607,83 @@ class WordPuzzleSolver:
             logger.info("Using fallback dictionary")
             return self._get_fallback_dictionary()
 
+    def _save_dictionary_cache(self, cache_file, words):
+        """Write the word set as a binary pickle for fast startup"""
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump(words, f, protocol=pickle.HIGHEST_PROTOCOL)
+            logger.info(f"Cached {len(words)} words to {cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to cache words: {e}")
+
+    def _build_anagram_index(self, words):
+        """Group playable words by their sorted-letter signature"""
+        anagrams = defaultdict(list)
+        # Set iteration order depends on PYTHONHASHSEED; sort so every worker builds the
+        # same buckets and the same board always gets the same words
+        for word in sorted(words):
+            if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH:
+                anagrams[''.join(sorted(word))].append(word)
+        return dict(anagrams)
+
+    def _build_anagram_dawg(self, anagrams):
+        """Minimized prefix graph over the sorted-letter signatures, '' marks a key end"""
+        root = {}
+        for key in anagrams:
+            node = root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = True
+        
+        # Merge identical subtrees bottom-up so common signature tails are stored once
+        registry = {}
+        def minimize(node):
+            for char, child in node.items():
+                if char:
+                    node[char] = minimize(child)
+            signature = tuple(sorted((char, id(child) if char else child)
+                                     for char, child in node.items()))
+            return registry.setdefault(signature, node)
+        return minimize(root)
+
     def _get_fallback_dictionary(self):
         """Fallback dictionary when online download fails"""
-        return {
-            # Most common English words - comprehensive fallback
-            'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM', 'HIS', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WHO', 'BOY', 'DID', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE', 'WAY', 'WHO', 'OIL', 'SIT', 'SET',
-            # 3-letter words
-            'ACE', 'ACT', 'ADD', 'AGE', 'AID', 'AIM', 'AIR', 'ARM', 'ART', 'ASK', 'ATE', 'BAD', 'BAG', 'BAR', 'BAT', 'BED', 'BEE', 'BET', 'BIG', 'BIT', 'BOX', 'BUY', 'CAR', 'CAT', 'COW', 'CRY', 'CUP', 'CUT', 'DOG', 'EAR', 'EAT', 'EGG', 'END', 'EYE', 'FAR', 'FEW', 'FLY', 'FOR', 'FUN', 'GOT', 'GUN', 'GUY', 'HAT', 'HIT', 'HOT', 'JOB', 'LAW', 'LAY', 'LEG', 'LET', 'LIE', 'LOT', 'LOW', 'MAN', 'MAP', 'NET', 'PAY', 'PEN', 'PET', 'PIG', 'POT', 'RAT', 'RED', 'RUN', 'SAD', 'SAT', 'SEA', 'SIT', 'SIX', 'SKY', 'SUN', 'TAX', 'TEA', 'TEN', 'TOP', 'TRY', 'VAN', 'WAR', 'WET', 'WIN', 'YES', 'YET', 'ZOO',
-            'FAT', 'FIT', 'FIX', 'FOG', 'FOX', 'FUR', 'GAP', 'GAS', 'GEL', 'GEM', 'GOD', 'ICE', 'ILL', 'INK', 'JAM', 'JAW', 'JOG', 'JOT', 'JOY', 'KEY', 'KID', 'KIT', 'LAB', 'LAG', 'LIT', 'LOG', 'MAD', 'MIX', 'MOB', 'MUD', 'NUT', 'ODD', 'ORB', 'OWL', 'OWN', 'PAD', 'PAN', 'PAR', 'PAW', 'PIN', 'PIT', 'PLY', 'POD', 'PRO', 'PUB', 'PUN', 'PUP', 'RAG', 'RAM', 'RAP', 'RAW', 'RAY', 'RIB', 'RID', 'RIM', 'RIP', 'ROB', 'ROD', 'ROT', 'ROW', 'RUB', 'RUG', 'RUM', 'RUT', 'SAP', 'SAW', 'SIN', 'SIP', 'SIR', 'SOB', 'SOD', 'SON', 'SOP', 'SOW', 'SOY', 'SPA', 'SPY', 'STY', 'TAB', 'TAG', 'TAN', 'TAP', 'TAR', 'TAT', 'TIC', 'TIE', 'TIN', 'TIP', 'TOE', 'TON', 'TOT', 'TOW', 'TOY', 'TUB', 'TUG', 'TUT', 'URN', 'VIA', 'VIE', 'VOW', 'WAD', 'WAG', 'WAN', 'WAX', 'WEB', 'WED', 'WEE', 'WIG', 'WIT', 'WOE', 'WOK', 'WON', 'WOO', 'WOW', 'YAK', 'YAM', 'YAP', 'YAW', 'YEA', 'YEN', 'YEP', 'YEW', 'YIN', 'YIP', 'YON', 'ZAP', 'ZED', 'ZEE', 'ZEN', 'ZIP', 'ZIT',
-            # 4+ letter words (common ones)
-            'ABLE', 'AREA', 'ARMY', 'BABY', 'BACK', 'BALL', 'BAND', 'BANK', 'BASE', 'BATH', 'BEAR', 'BEAT', 'BEEN', 'BELL', 'BEST', 'BILL', 'BIRD', 'BLOW', 'BLUE', 'BOAT', 'BODY', 'BONE', 'BOOK', 'BORN', 'BOTH', 'BOYS', 'BUSY', 'CALL', 'CAME', 'CAMP', 'CARD', 'CARE', 'CARS', 'CASE', 'CASH', 'CELL', 'CITY', 'CLUB', 'COAL', 'COAT', 'COLD', 'COME', 'COOK', 'COOL', 'COPY', 'CORN', 'COST', 'CREW', 'DARK', 'DATA', 'DATE', 'DAYS', 'DEAD', 'DEAL', 'DEAR', 'DEEP', 'DESK', 'DOES', 'DONE', 'DOOR', 'DOWN', 'DRAW', 'DREW', 'DROP', 'DRUG', 'EACH', 'EARN', 'EAST', 'EASY', 'EDGE', 'ELSE', 'EVEN', 'EVER', 'FACE', 'FACT', 'FAIL', 'FAIR', 'FALL', 'FARM', 'FAST', 'FEAR', 'FEEL', 'FEET', 'FELL', 'FELT', 'FILE', 'FILL', 'FILM', 'FIND', 'FINE', 'FIRE', 'FIRM', 'FISH', 'FIVE', 'FLAT', 'FLOW', 'FOOD', 'FOOT', 'FORM', 'FOUR', 'FREE', 'FROM', 'FULL', 'FUND', 'GAME', 'GAVE', 'GIRL', 'GIVE', 'GLAD', 'GOES', 'GOLD', 'GONE', 'GOOD', 'GREW', 'GROW', 'HAIR', 'HALF', 'HALL', 'HAND', 'HARD', 'HARM', 'HEAD', 'HEAR', 'HEAT', 'HELD', 'HELP', 'HERE', 'HIGH', 'HILL', 'HOLD', 'HOME', 'HOPE', 'HOUR', 'HUGE', 'IDEA', 'INTO', 'ITEM', 'JOBS', 'JOIN', 'JUMP', 'JUST', 'KEEP', 'KEPT', 'KIND', 'KING', 'KNEW', 'KNOW', 'LAND', 'LAST', 'LATE', 'LEAD', 'LEFT', 'LESS', 'LIFE', 'LIKE', 'LINE', 'LIST', 'LIVE', 'LOAN', 'LONG', 'LOOK', 'LORD', 'LOSE', 'LOSS', 'LOST', 'LOVE', 'MADE', 'MAIL', 'MAIN', 'MAKE', 'MALE', 'MANY', 'MARK', 'MASS', 'MEAT', 'MEET', 'MIND', 'MINE', 'MISS', 'MODE', 'MORE', 'MOST', 'MOVE', 'MUCH', 'MUST', 'NAME', 'NEAR', 'NECK', 'NEED', 'NEWS', 'NEXT', 'NICE', 'NINE', 'NODE', 'NONE', 'NOON', 'NOTE', 'OPEN', 'ORAL', 'OVER', 'PAGE', 'PAID', 'PAIN', 'PAIR', 'PARK', 'PART', 'PASS', 'PAST', 'PATH', 'PEAK', 'PICK', 'PINK', 'PLAN', 'PLAY', 'PLOT', 'PLUS', 'POLL', 'POOL', 'POOR', 'PORT', 'POST', 'PULL', 'PURE', 'PUSH', 'RACE', 'RAIN', 'RANK', 'RATE', 'READ', 'REAL', 'REAR', 'RELY', 'REST', 'RICH', 'RIDE', 'RING', 'RISE', 'RISK', 'ROAD', 'ROCK', 'ROLE', 'ROLL', 'ROOM', 'ROOT', 'ROSE', 'RULE', 'RUNS', 'SAFE', 'SAID', 'SALE', 'SAME', 'SAVE', 'SEAT', 'SEEM', 'SELF', 'SELL', 'SEND', 'SENT', 'SHIP', 'SHOP', 'SHOT', 'SHOW', 'SICK', 'SIDE', 'SIGN', 'SITE', 'SIZE', 'SKIN', 'SLIP', 'SLOW', 'SNOW', 'SOFT', 'SOIL', 'SOLD', 'SOME', 'SONG', 'SOON', 'SORT', 'SOUL', 'SPOT', 'STAR', 'STAY', 'STEP', 'STOP', 'SUCH', 'SURE', 'TAKE', 'TALK', 'TALL', 'TANK', 'TAPE', 'TASK', 'TEAM', 'TELL', 'TERM', 'TEST', 'TEXT', 'THAN', 'THAT', 'THEN', 'THEY', 'THIN', 'THIS', 'TIME', 'TOLD', 'TONE', 'TOOK', 'TOOL', 'TOUR', 'TOWN', 'TREE', 'TRUE', 'TURN', 'TYPE', 'UNIT', 'UPON', 'USED', 'USER', 'VARY', 'VAST', 'VERY', 'VIEW', 'VOTE', 'WAGE', 'WAIT', 'WAKE', 'WALK', 'WALL', 'WANT', 'WARD', 'WARM', 'WASH', 'WAVE', 'WAYS', 'WEAK', 'WEAR', 'WEEK', 'WELL', 'WENT', 'WERE', 'WEST', 'WHAT', 'WHEN', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINE', 'WING', 'WIRE', 'WISE', 'WISH', 'WITH', 'WOOD', 'WORD', 'WORE', 'WORK', 'YARD', 'YEAH', 'YEAR', 'YOUR', 'ZERO', 'ZONE',
-            # Common 5+ letter words
-            'ABOUT', 'ABOVE', 'ABUSE', 'ACTOR', 'ACUTE', 'ADMIT', 'ADOPT', 'ADULT', 'AFTER', 'AGAIN', 'AGENT', 'AGREE', 'AHEAD', 'ALARM', 'ALBUM', 'ALERT', 'ALIEN', 'ALIGN', 'ALIKE', 'ALIVE', 'ALLOW', 'ALONE', 'ALONG', 'ALTER', 'ANGLE', 'ANGRY', 'APART', 'APPLE', 'APPLY', 'ARENA', 'ARGUE', 'ARISE', 'ARRAY', 'ASIDE', 'ASSET', 'AVOID', 'AWAKE', 'AWARD', 'AWARE', 'BADLY', 'BASIC', 'BEACH', 'BEGAN', 'BEGIN', 'BEING', 'BENCH', 'BIRTH', 'BLACK', 'BLAME', 'BLANK', 'BLIND', 'BLOCK', 'BLOOD', 'BOARD', 'BOOST', 'BOOTH', 'BOUND', 'BRAIN', 'BRAND', 'BREAD', 'BREAK', 'BREED', 'BRIEF', 'BRING', 'BROAD', 'BROKE', 'BROWN', 'BUILD', 'BUILT', 'CATCH', 'CAUSE', 'CHAIN', 'CHAIR', 'CHAOS', 'CHARM', 'CHART', 'CHASE', 'CHEAP', 'CHECK', 'CHEST', 'CHIEF', 'CHILD', 'CHINA', 'CHOSE', 'CIVIL', 'CLAIM', 'CLASS', 'CLEAN', 'CLEAR', 'CLICK', 'CLIMB', 'CLOCK', 'CLOSE', 'CLOUD', 'COACH', 'COAST', 'COULD', 'COUNT', 'COURT', 'COVER', 'CRAFT', 'CRASH', 'CRAZY', 'CREAM', 'CRIME', 'CROSS', 'CROWD', 'CROWN', 'CRUDE', 'CURVE', 'CYCLE', 'DAILY', 'DANCE', 'DATED', 'DEALT', 'DEATH', 'DEBUT', 'DELAY', 'DEPTH', 'DOING', 'DOUBT', 'DOZEN', 'DRAFT', 'DRAMA', 'DRANK', 'DREAM', 'DRESS', 'DRILL', 'DRINK', 'DRIVE', 'DROVE', 'DYING', 'EAGER', 'EARLY', 'EARTH', 'EIGHT', 'ELITE', 'EMPTY', 'ENEMY', 'ENJOY', 'ENTER', 'ENTRY', 'EQUAL', 'ERROR', 'EVENT', 'EVERY', 'EXACT', 'EXIST', 'EXTRA', 'FAITH', 'FALSE', 'FAULT', 'FIELD', 'FIFTH', 'FIFTY', 'FIGHT', 'FINAL', 'FIRST', 'FIXED', 'FLASH', 'FLEET', 'FLOOR', 'FLUID', 'FOCUS', 'FORCE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FRAME', 'FRANK', 'FRAUD', 'FRESH', 'FRONT', 'FRUIT', 'FULLY', 'FUNNY', 'GIANT', 'GIVEN', 'GLASS', 'GLOBE', 'GOING', 'GRACE', 'GRADE', 'GRAND', 'GRANT', 'GRASS', 'GRAVE', 'GREAT', 'GREEN', 'GROSS', 'GROUP', 'GROWN', 'GUARD', 'GUESS', 'GUEST', 'GUIDE', 'HAPPY', 'HARSH', 'HEART', 'HEAVY', 'HENCE', 'HORSE', 'HOTEL', 'HOUSE', 'HUMAN', 'IDEAL', 'IMAGE', 'INDEX', 'INNER', 'INPUT', 'ISSUE', 'JAPAN', 'JOINT', 'JUDGE', 'KNOWN', 'LABEL', 'LARGE', 'LASER', 'LATER', 'LAUGH', 'LAYER', 'LEARN', 'LEASE', 'LEAST', 'LEAVE', 'LEGAL', 'LEVEL', 'LIGHT', 'LIMIT', 'LINKS', 'LIVES', 'LOCAL', 'LOOSE', 'LOWER', 'LUCKY', 'LUNCH', 'LYING', 'MAGIC', 'MAJOR', 'MAKER', 'MARCH', 'MATCH', 'MAYBE', 'MAYOR', 'MEANT', 'MEDIA', 'METAL', 'MIGHT', 'MINOR', 'MINUS', 'MIXED', 'MODEL', 'MONEY', 'MONTH', 'MORAL', 'MOTOR', 'MOUNT', 'MOUSE', 'MOUTH', 'MOVED', 'MOVIE', 'MUSIC', 'NEEDS', 'NEVER', 'NEWLY', 'NIGHT', 'NOISE', 'NORTH', 'NOTED', 'NOVEL', 'NURSE', 'OCCUR', 'OCEAN', 'OFFER', 'OFTEN', 'ORDER', 'OTHER', 'OUGHT', 'PAINT', 'PANEL', 'PAPER', 'PARTY', 'PEACE', 'PHASE', 'PHONE', 'PHOTO', 'PIANO', 'PIECE', 'PILOT', 'PITCH', 'PLACE', 'PLAIN', 'PLANE', 'PLANT', 'PLATE', 'POINT', 'POUND', 'POWER', 'PRESS', 'PRICE', 'PRIDE', 'PRIME', 'PRINT', 'PRIOR', 'PRIZE', 'PROOF', 'PROUD', 'PROVE', 'QUEEN', 'QUICK', 'QUIET', 'QUITE', 'RADIO', 'RAISE', 'RANGE', 'RAPID', 'RATIO', 'REACH', 'READY', 'REALM', 'REBEL', 'REFER', 'RELAX', 'RELAY', 'REPLY', 'RIGHT', 'RIGID', 'RIVAL', 'RIVER', 'ROBOT', 'ROMAN', 'ROUGH', 'ROUND', 'ROUTE', 'ROYAL', 'RURAL', 'SCALE', 'SCENE', 'SCOPE', 'SCORE', 'SENSE', 'SERVE', 'SEVEN', 'SHALL', 'SHAPE', 'SHARE', 'SHARP', 'SHEET', 'SHELF', 'SHELL', 'SHIFT', 'SHINE', 'SHIRT', 'SHOCK', 'SHOOT', 'SHORT', 'SHOWN', 'SIDES', 'SIGHT', 'SILLY', 'SINCE', 'SIXTH', 'SIXTY', 'SIZED', 'SKILL', 'SLEEP', 'SLIDE', 'SMALL', 'SMART', 'SMILE', 'SMITH', 'SMOKE', 'SOLID', 'SOLVE', 'SORRY', 'SOUND', 'SOUTH', 'SPACE', 'SPARE', 'SPEAK', 'SPEED', 'SPEND', 'SPENT', 'SPLIT', 'SPOKE', 'SPORT', 'STAFF', 'STAGE', 'STAKE', 'STAND', 'START', 'STATE', 'STEAM', 'STEEL', 'STEEP', 'STEER', 'STICK', 'STILL', 'STOCK', 'STONE', 'STOOD', 'STORE', 'STORM', 'STORY', 'STRIP', 'STUCK', 'STUDY', 'STUFF', 'STYLE', 'SUGAR', 'SUITE', 'SUPER', 'SWEET', 'SWIFT', 'SWING', 'SWISS', 'TABLE', 'TAKEN', 'TASTE', 'TAXES', 'TEACH', 'TEENS', 'TEETH', 'TEMPO', 'TERMS', 'TEXAS', 'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE', 'THESE', 'THICK', 'THING', 'THINK', 'THIRD', 'THOSE', 'THREE', 'THREW', 'THROW', 'THUMB', 'TIGER', 'TIGHT', 'TIMER', 'TIRED', 'TITLE', 'TODAY', 'TOPIC', 'TOTAL', 'TOUCH', 'TOUGH', 'TOWER', 'TRACK', 'TRADE', 'TRAIL', 'TRAIN', 'TREAT', 'TREND', 'TRIAL', 'TRIBE', 'TRICK', 'TRIED', 'TRIES', 'TRUCK', 'TRULY', 'TRUNK', 'TRUST', 'TRUTH', 'TWICE', 'TWIST', 'ULTRA', 'UNCLE', 'UNDER', 'UNDUE', 'UNION', 'UNITY', 'UNTIL', 'UPPER', 'UPSET', 'URBAN', 'USAGE', 'USUAL', 'VALID', 'VALUE', 'VIDEO', 'VIRUS', 'VISIT', 'VITAL', 'VOCAL', 'VOICE', 'WASTE', 'WATCH', 'WATER', 'WHEEL', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHOLE', 'WHOSE', 'WOMAN', 'WOMEN', 'WORLD', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WRITE', 'WRONG', 'WROTE', 'YOUNG', 'YOUTH',
-            # Additional useful words for word games
-            'PART', 'TRAP', 'RAPT', 'TARP', 'PRAT', 'ART', 'RAT', 'PAT', 'TAR', 'TAP'
-        }
+        return FALLBACK_WORDS
 
     def solve_puzzle(self, image_path):
         """Main puzzle solving function"""
+        return self.solve_puzzle_array(self._load_image(image_path))
+
+    def solve_puzzle_bytes(self, data):
+        """Solve a puzzle from encoded image bytes without touching disk"""
+        # Repeated uploads of the same screenshot skip OCR entirely
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+                logger.info("Returning cached result for previously seen image")
+                return result
+
+        result = self.solve_puzzle_array(self._decode_image(data))
+        # An empty result may come from a transient failure, so let the next upload retry it
+        if not result["swipes"]:
+            return result
+
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def solve_puzzle_array(self, img):
+        """Solve a puzzle from a decoded image (BGR array, or PIL image without OpenCV)"""
         try:
-            letters_data = self._detect_letters(image_path)
+            if img is None:
+                logger.error("Failed to load image")
+                return {"swipes": []}
+
+            letters_data = self._detect_letters(img)
             if not letters_data:
                 logger.warning("No letters detected in image")
                 return {"swipes": []}
@@ -102,61 +696,106 @@ class WordPuzzleSolver:
             logger.error(f"Solver error: {e}")
             return {"swipes": []}
 
-    def _detect_letters(self, image_path):
+    def _load_image(self, image_path):
+        """Load an image from disk in the format the detectors expect"""
+        try:
+            if OPENCV_AVAILABLE:
+                return cv2.imread(image_path)
+            return Image.open(image_path)
+
+        except Exception as e:
+            logger.error(f"Image load error: {e}")
+            return None
+
+    def _decode_image(self, data):
+        """Decode in-memory image bytes in the format the detectors expect"""
+        try:
+            if OPENCV_AVAILABLE:
+                return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+            return Image.open(io.BytesIO(data))
+
+        except Exception as e:
+            logger.error(f"Image decode error: {e}")
+            return None
+
+    def _detect_letters(self, img):
         """Enhanced letter detection with PIL fallback when OpenCV fails"""
         try:
             if OPENCV_AVAILABLE:
-                return self._detect_letters_opencv(image_path)
+                return self._detect_letters_opencv(img)
             else:
-                return self._detect_letters_pil(image_path)
+                return self._detect_letters_pil(img)
 
         except Exception as e:
             logger.error(f"Detection error: {e}")
             return []
 
-    def _detect_letters_opencv(self, image_path):
+    def _detect_letters_opencv(self, img):
         """OpenCV-based letter detection"""
         try:
-            img = cv2.imread(image_path)
-            if img is None:
-                logger.error("Failed to load image")
-                return []
-
             h, w = img.shape[:2]
             logger.info(f"Processing image dimensions: {w}x{h}")
 
-            # Try multiple detection strategies in order of reliability
-            # Strategy 1: Look for circular letter wheel
-            letters = self._detect_circular_wheel(img)
-            if letters and len(letters) >= 3:
-                logger.info(f"Found {len(letters)} letters using circular detection")
-                return letters
+            # Detect on a downsampled copy; pixel thresholds scale with it
+            scale = WORK_WIDTH / w if w > WORK_WIDTH else 1.0
+            if scale < 1.0:
+                img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
 
-            # Strategy 2: Look for grid-based letters in bottom half
-            letters = self._detect_grid_layout(img)
-            if letters and len(letters) >= 3:
-                logger.info(f"Found {len(letters)} letters using grid detection")
-                return letters
-
-            # Strategy 3: General contour-based detection
-            letters = self._detect_letters_fallback(img)
-            if letters and len(letters) >= 3:
-                logger.info(f"Found {len(letters)} letters using fallback detection")
-                return letters
-
-            # Strategy 4: Search entire image for any text
-            letters = self._detect_letters_full_scan(img)
-            logger.info(f"Found {len(letters)} letters using full scan")
-            return letters
+            letters = self._detect_letters_scaled(img, scale)
+            return self._rescale_letters(letters, scale)
 
         except Exception as e:
             logger.error(f"OpenCV detection error: {e}")
             return []
 
-    def _detect_letters_pil(self, image_path):
+    def _detect_letters_scaled(self, img, scale):
+        """Run the detection strategies on an image downsampled by scale"""
+        # Try multiple detection strategies in order of reliability
+        strategies = [
+            ("circular detection", self._detect_circular_wheel),  # Strategy 1: circular letter wheel
+            ("grid detection", self._detect_grid_layout),  # Strategy 2: grid-based letters
+            ("fallback detection", self._detect_letters_fallback),  # Strategy 3: general contours
+            ("full scan", self._detect_letters_full_scan),  # Strategy 4: any text in the image
+        ]
+        
+        # Every strategy works from the grayscale frame, so convert it once and let them slice it
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        
+        # Overlap only the grid strategy with the wheel; fallback and full scan run only when
+        # everything before them failed, so a solved wheel wastes at most one strategy's OCR.
+        # Worst case is max(wheel, grid) + fallback + full scan with a free pool thread, and
+        # the sequential wheel + grid + fallback + full scan when the pool is saturated
+        futures = {1: self.strategy_pool.submit(strategies[1][1], img, gray, scale)}
+        try:
+            # Results are taken in order, so the most reliable success wins
+            for i, (name, detect) in enumerate(strategies):
+                future = futures.get(i)
+                if future is not None and not future.cancel():
+                    letters = future.result()
+                else:
+                    # Not speculated, or still queued behind other requests: run it here
+                    letters = detect(img, gray, scale)
+                if (letters and len(letters) >= 3) or name == "full scan":
+                    logger.info(f"Found {len(letters)} letters using {name}")
+                    return letters
+        finally:
+            # Drop speculative work that has not started yet
+            for future in futures.values():
+                future.cancel()
+
+    def _rescale_letters(self, letters, scale):
+        """Map letter coordinates from the working image back to the original"""
+        if scale == 1.0:
+            return letters
+
+        for letter in letters:
+            letter['x'] = int(round(letter['x'] / scale))
+            letter['y'] = int(round(letter['y'] / scale))
+        return letters
+
+    def _detect_letters_pil(self, img):
         """PIL-based letter detection as fallback"""
         try:
-            img = Image.open(image_path)
             w, h = img.size
             logger.info(f"Processing image dimensions: {w}x{h} (PIL mode)")
 
@@ -188,19 +827,14 @@ class WordPuzzleSolver:
             bottom_y = int(h * 0.6)
             bottom_section = img.crop((0, bottom_y, w, h))
             
-            # Convert to grayscale and enhance
+            # Convert to grayscale
             gray = bottom_section.convert('L')
             
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(gray)
-            enhanced = enhancer.enhance(2.0)
-            
-            # Apply threshold to get binary image
-            threshold = 128
-            binary = enhanced.point(lambda x: 255 if x > threshold else 0, '1')
+            # Enhance contrast and threshold to a binary image in one table lookup
+            binary = gray.point(contrast_table(gray, 2.0, threshold=128), '1')
             
             # Use OCR on the processed bottom section
-            text = pytesseract.image_to_string(binary, config=self.tesseract_config).strip()
+            text = self._ocr_word(binary)
             
             letters = []
             if text:
@@ -246,13 +880,12 @@ class WordPuzzleSolver:
                 try:
                     section = img.crop((x1, y1, x2, y2))
                     
-                    # Convert to grayscale and enhance
+                    # Convert to grayscale and enhance contrast with a table lookup
                     gray = section.convert('L')
-                    enhancer = ImageEnhance.Contrast(gray)
-                    enhanced = enhancer.enhance(1.5)
+                    enhanced = gray.point(contrast_table(gray, 1.5))
                     
                     # Use OCR to detect text
-                    text = pytesseract.image_to_string(enhanced, config=self.tesseract_config).strip()
+                    text = self._ocr_word(enhanced)
                     
                     if text:
                         unique_letters = list(set(c.upper() for c in text if c.isalpha()))
@@ -283,142 +916,147 @@ class WordPuzzleSolver:
             logger.error(f"PIL sectional detection error: {e}")
             return []
 
-    def _detect_circular_wheel(self, img):
+    def _detect_circular_wheel(self, img, gray, scale=1.0):
         """Detect letters in circular arrangement (like the bottom of your image)"""
         try:
             h, w = img.shape[:2]
+            offset_y = int(h * 0.6)
             
             # Focus on bottom portion where circular wheel typically is
-            bottom_section = img[int(h * 0.6):, :]
-            
-            # Convert to grayscale and apply preprocessing
-            gray = cv2.cvtColor(bottom_section, cv2.COLOR_BGR2GRAY)
+            bottom_section = img[offset_y:, :]
+            wheel = self._locate_wheel(bottom_section, gray[offset_y:, :], scale)
+            if wheel is None:
+                return []
+            cx, cy, radius, wheel_mask = wheel
             
-            # Apply adaptive threshold for better text detection
-            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                         cv2.THRESH_BINARY_INV, 11, 2)
+            # Letters are the dark regions enclosed by the wheel
+            sh, sw = wheel_mask.shape
+            x0, x1 = max(0, int(cx - radius)), min(sw, int(cx + radius) + 1)
+            y0, y1 = max(0, int(cy - radius)), min(sh, int(cy + radius) + 1)
+            ys, xs = np.ogrid[y0:y1, x0:x1]
+            inside = (xs - cx) ** 2 + (ys - cy) ** 2 < (0.9 * radius) ** 2
+            letter_mask = np.where(inside & ~wheel_mask[y0:y1, x0:x1], 255, 0).astype(np.uint8)
             
-            # Find circles using HoughCircles
-            circles = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT, 1, 20,
-                                     param1=50, param2=30, minRadius=10, maxRadius=100)
+            n, _, letter_stats, _ = cv2.connectedComponentsWithStats(letter_mask, connectivity=8)
             
-            letters = []
-            if circles is not None:
-                circles = np.round(circles[0, :]).astype("int")
-                for (x, y, r) in circles:
-                    # Extract region around circle
-                    roi = thresh[max(0, y-r):y+r, max(0, x-r):x+r]
-                    if roi.size > 0:
-                        # Use OCR to detect letter
-                        letter = pytesseract.image_to_string(roi, config=self.tesseract_config).strip()
-                        if letter and letter.isalpha() and len(letter) == 1:
-                            letters.append({
-                                'letter': letter.upper(),
-                                'x': x,
-                                'y': y + int(h * 0.6),  # Adjust for bottom section offset
-                                'confidence': 0.8
-                            })
+            candidates = []
+            for lx, ly, lw, lh, area in letter_stats[1:].tolist():
+                # Keep blobs sized like a wheel letter
+                if not (0.1 * radius <= lh <= 0.6 * radius and area >= 20 * scale * scale):
+                    continue
+                
+                # White-on-black ROI, padded for better OCR
+                roi = letter_mask[ly:ly+lh, lx:lx+lw]
+                padded_roi = cv2.copyMakeBorder(roi, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=0)
+                
+                # Adjust for wheel crop and bottom section offsets
+                candidates.append((padded_roi, x0 + lx + lw // 2, offset_y + y0 + ly + lh // 2))
             
-            return letters
+            # OCR all wheel letters in one batch
+            return self._ocr_candidates(candidates, 0.8)
             
         except Exception as e:
             logger.error(f"Circular detection error: {e}")
             return []
 
-    def _detect_grid_layout(self, img):
+    def _locate_wheel(self, section, gray, scale):
+        """Find the letter wheel in a BGR section and its grayscale, returning (cx, cy, radius, wheel_mask) or None"""
+        if WHEEL_HSV_RANGE is not None:
+            # Known wheel colour: one HSV conversion and mask give the wheel pixels directly
+            hsv = cv2.cvtColor(section, cv2.COLOR_BGR2HSV)
+            wheel_mask = cv2.inRange(hsv, *WHEEL_HSV_RANGE) > 0
+            ys, xs = np.nonzero(wheel_mask)
+            if xs.size == 0:
+                return None
+            
+            cx, cy = (xs.max() + xs.min()) / 2, (ys.max() + ys.min()) / 2
+            radius = (xs.max() - xs.min()) / 2
+        else:
+            # The wheel is the largest bright blob: one Otsu pass plus connected components
+            _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            n, labels, stats, centroids = cv2.connectedComponentsWithStats(bw, connectivity=8)
+            if n < 2:
+                return None
+            
+            wheel = int(np.argmax(stats[1:, cv2.CC_STAT_AREA])) + 1
+            # A blob spanning the whole section is background, not a wheel
+            if stats[wheel, cv2.CC_STAT_WIDTH] >= section.shape[1]:
+                return None
+            
+            cx, cy = centroids[wheel]
+            radius = np.sqrt(stats[wheel, cv2.CC_STAT_AREA] / np.pi)
+            wheel_mask = labels == wheel
+        
+        # Reject noise too small to be a wheel
+        if radius < 40 * scale:
+            return None
+        return cx, cy, radius, wheel_mask
+
+    def _detect_grid_layout(self, img, gray, scale=1.0):
         """Detect letters in grid layout"""
         try:
             h, w = img.shape[:2]
             
             # Focus on middle-bottom area where grids typically are
-            grid_section = img[int(h * 0.2):int(h * 0.8), :]
-            
-            gray = cv2.cvtColor(grid_section, cv2.COLOR_BGR2GRAY)
+            grid_section = gray[int(h * 0.2):int(h * 0.8), :]
             
             # Apply morphological operations to isolate text regions
             kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-            thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+            thresh = cv2.adaptiveThreshold(grid_section, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                                          cv2.THRESH_BINARY_INV, 15, 4)
             
-            # Find contours with OpenCV compatibility fix
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2:]
+            # Filter for reasonable letter-sized rectangles
+            areas, rects = component_stats(thresh)
+            mask = filter_contours(areas, rects, -1.0, np.inf, 15.0 * scale, 60.0 * scale, 0.0, np.inf)
             
-            letters = []
-            for contour in contours:
-                x, y, w_rect, h_rect = cv2.boundingRect(contour)
+            candidates = []
+            for x, y, w_rect, h_rect in rects[mask].tolist():
+                # Extract ROI
+                roi = thresh[y:y+h_rect, x:x+w_rect]
                 
-                # Filter for reasonable letter-sized rectangles
-                if 15 <= w_rect <= 60 and 15 <= h_rect <= 60:
-                    # Extract ROI
-                    roi = thresh[y:y+h_rect, x:x+w_rect]
-                    
-                    # Use OCR
-                    letter = pytesseract.image_to_string(roi, config=self.tesseract_config).strip()
-                    if letter and letter.isalpha() and len(letter) == 1:
-                        letters.append({
-                            'letter': letter.upper(),
-                            'x': x + w_rect // 2,
-                            'y': y + h_rect // 2 + int(h * 0.2),  # Adjust for section offset
-                            'confidence': 0.7
-                        })
+                # Adjust for section offset
+                candidates.append((roi, x + w_rect // 2, y + h_rect // 2 + int(h * 0.2)))
             
-            return letters
+            # OCR all letter-sized regions in one batch
+            return self._ocr_candidates(candidates, 0.7)
             
         except Exception as e:
             logger.error(f"Grid detection error: {e}")
             return []
 
-    def _detect_letters_fallback(self, img):
+    def _detect_letters_fallback(self, img, gray, scale=1.0):
         """General contour-based letter detection with OpenCV compatibility"""
         try:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            
             # Apply Gaussian blur to reduce noise
             blur = cv2.GaussianBlur(gray, (5, 5), 0)
             
             # Use Otsu's thresholding
             _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
             
-            # Find contours with compatibility fix
-            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[-2:]
+            # Filter by area and for letter-like shapes
+            areas, rects = component_stats(thresh)
+            area_scale = scale * scale
+            mask = filter_contours(areas, rects, 100.0 * area_scale, 5000.0 * area_scale, 0.0, np.inf, 0.2, 2.0)
             
-            letters = []
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if 100 < area < 5000:  # Filter by area
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = w / h
-                    
-                    # Filter for letter-like shapes
-                    if 0.2 < aspect_ratio < 2.0:
-                        # Extract ROI and pad it
-                        roi = thresh[y:y+h, x:x+w]
-                        
-                        # Pad the ROI for better OCR
-                        padded_roi = cv2.copyMakeBorder(roi, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=0)
-                        
-                        # Use OCR
-                        letter = pytesseract.image_to_string(padded_roi, config=self.tesseract_config).strip()
-                        if letter and letter.isalpha() and len(letter) == 1:
-                            letters.append({
-                                'letter': letter.upper(),
-                                'x': x + w // 2,
-                                'y': y + h // 2,
-                                'confidence': 0.6
-                            })
+            candidates = []
+            for x, y, w, h in rects[mask].tolist():
+                # Extract ROI and pad it
+                roi = thresh[y:y+h, x:x+w]
+                
+                # Pad the ROI for better OCR
+                padded_roi = cv2.copyMakeBorder(roi, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=0)
+                candidates.append((padded_roi, x + w // 2, y + h // 2))
             
-            return letters
+            # OCR all letter-like regions in one batch
+            return self._ocr_candidates(candidates, 0.6)
             
         except Exception as e:
             logger.error(f"Fallback detection error: {e}")
             return []
 
-    def _detect_letters_full_scan(self, img):
+    def _detect_letters_full_scan(self, img, gray, scale=1.0):
         """Full image scan for any text - last resort"""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            
             # Try different preprocessing approaches
             approaches = [
                 cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2),
@@ -431,7 +1069,7 @@ class WordPuzzleSolver:
             for thresh in approaches:
                 # Use OCR on entire image
                 try:
-                    data = pytesseract.image_to_data(thresh, config='--psm 6', output_type=pytesseract.Output.DICT)
+                    data = pytesseract.image_to_data(thresh, config=TESS_SCAN_CONFIG, output_type=pytesseract.Output.DICT)
                     
                     for i, text in enumerate(data['text']):
                         if text.strip() and text.isalpha() and len(text.strip()) == 1:
@@ -449,23 +1087,23 @@ class WordPuzzleSolver:
                 except Exception:
                     continue
             
-            # Remove duplicates (letters detected multiple times)
+            if not all_letters:
+                return []
+            
+            # Remove duplicates (letters detected multiple times), keeping the most confident;
+            # kept letters are hashed into cells of the dedup distance, so a hit only has to
+            # be compared with the same letter in its own and the eight neighbouring cells
+            dedup_dist = 30 * scale
+            cells = defaultdict(list)
             unique_letters = []
-            for letter in all_letters:
-                is_duplicate = False
-                for existing in unique_letters:
-                    if (letter['letter'] == existing['letter'] and 
-                        abs(letter['x'] - existing['x']) < 30 and 
-                        abs(letter['y'] - existing['y']) < 30):
-                        is_duplicate = True
-                        # Keep the one with higher confidence
-                        if letter['confidence'] > existing['confidence']:
-                            unique_letters.remove(existing)
-                            unique_letters.append(letter)
-                        break
-                
-                if not is_duplicate:
-                    unique_letters.append(letter)
+            for letter in sorted(all_letters, key=lambda x: -x['confidence']):
+                cx, cy = int(letter['x'] // dedup_dist), int(letter['y'] // dedup_dist)
+                if any(abs(other['x'] - letter['x']) < dedup_dist and abs(other['y'] - letter['y']) < dedup_dist
+                       for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                       for other in cells.get((letter['letter'], cx + dx, cy + dy), ())):
+                    continue
+                cells[(letter['letter'], cx, cy)].append(letter)
+                unique_letters.append(letter)
             
             return unique_letters
             
@@ -482,64 +1120,87 @@ class WordPuzzleSolver:
             available_letters = [letter['letter'] for letter in letters_data]
             logger.info(f"Available letters: {available_letters}")
             
-            valid_words = []
-            
-            # Try different word lengths
-            for length in range(3, min(len(available_letters) + 1, 8)):
-                for combination in itertools.permutations(available_letters, length):
-                    word = ''.join(combination)
-                    if word in self.dictionary:
-                        # Calculate swipe path
-                        path = self._calculate_swipe_path(word, letters_data)
-                        if path:
-                            valid_words.append({
-                                'word': word,
-                                'path': path,
-                                'score': len(word) * 10  # Simple scoring
-                            })
+            # Index board slots by letter once for all candidate words
+            letter_positions = defaultdict(list)
+            for i, letter in enumerate(available_letters):
+                letter_positions[letter].append(i)
             
-            # Sort by score and word length
-            valid_words.sort(key=lambda x: (-x['score'], -len(x['word'])))
+            words = self._top_words(available_letters)
             
-            # Return top 20 words to avoid overwhelming response
-            return valid_words[:20]
+            # Calculate swipe paths as board slot indices, then build the response dicts
+            # straight from the (word, slots) tuples and one (x, y, letter) tuple per slot
+            board = [(letter['x'], letter['y'], letter['letter']) for letter in letters_data]
+            return [{
+                'word': word,
+                'path': [{'x': x, 'y': y, 'letter': letter} for x, y, letter in map(board.__getitem__, slots)],
+                'score': len(word) * 10  # Simple scoring
+            } for word, slots in assemble_paths(words, letter_positions)]
             
         except Exception as e:
             logger.error(f"Word generation error: {e}")
             return []
 
-    def _calculate_swipe_path(self, word, letters_data):
-        """Calculate the swipe path for a given word"""
-        try:
-            path = []
-            used_positions = set()
-            
-            for letter in word:
-                # Find available position for this letter
-                found = False
-                for i, letter_data in enumerate(letters_data):
-                    if (letter_data['letter'] == letter and i not in used_positions):
-                        path.append({
-                            'x': letter_data['x'],
-                            'y': letter_data['y'],
-                            'letter': letter
-                        })
-                        used_positions.add(i)
-                        found = True
-                        break
-                
-                if not found:
-                    # Letter not available, invalid word
-                    return None
-            
-            return path
-            
-        except Exception as e:
-            logger.error(f"Path calculation error: {e}")
-            return None
+    def _top_words(self, available_letters):
+        """Return the best MAX_RESULTS words spellable from the available letters"""
+        # The words depend only on the board's letter multiset, so a board seen before in a
+        # different screenshot, or with its letters in other positions, skips the walk
+        board_key = ''.join(sorted(available_letters))
+        with self._word_cache_lock:
+            words = self._word_cache.get(board_key)
+            if words is not None:
+                self._word_cache.move_to_end(board_key)
+                return words
+        
+        # Score grows with length, so fill the response longest words first, alphabetical
+        # within a length; keys are grouped first so shorter lengths are never expanded
+        # once the longer ones fill the response
+        keys_by_length = defaultdict(list)
+        for key in self._candidate_keys(available_letters):
+            keys_by_length[len(key)].append(key)
+        words = []
+        for length in sorted(keys_by_length, reverse=True):
+            same_length = sorted(word for key in keys_by_length[length] for word in self.anagrams[key])
+            words.extend(same_length[:MAX_RESULTS - len(words)])
+            if len(words) >= MAX_RESULTS:
+                break
+        words = tuple(words)
+        
+        with self._word_cache_lock:
+            self._word_cache[board_key] = words
+            if len(self._word_cache) > WORD_CACHE_SIZE:
+                self._word_cache.popitem(last=False)
+        return words
+
+    def _candidate_keys(self, available_letters):
+        """Return the anagram keys that can be spelled from the available letters"""
+        # Walk the signature graph with the board's letter multiset, pruning prefixes
+        # no word starts with instead of enumerating letter combinations. A branch is
+        # entered only while its letter's count is positive, so every key reached is
+        # already a sub-multiset of the board: per-word bitmask, SWAR, Counter or NumPy
+        # subset filters would only re-check keys the walk accepted, or bring back a
+        # scan over the whole dictionary
+        board_counts = Counter(available_letters)
+        letters = sorted(board_counts)
+        counts = [board_counts[char] for char in letters]
+        max_length = min(len(available_letters), MAX_WORD_LENGTH)
+        
+        keys = []
+        walk_anagram_dawg(self.anagram_dawg, letters, counts, 0, '', max_length, keys)
+        return keys
+
+# Shared solver for the API and the backward compatibility function, created on first use
+_SOLVER = None
+_SOLVER_LOCK = threading.Lock()
+
+def get_solver():
+    """Process-wide solver, so the dictionary is loaded and indexed only once"""
+    global _SOLVER
+    if _SOLVER is None:
+        with _SOLVER_LOCK:
+            if _SOLVER is None:
+                _SOLVER = WordPuzzleSolver()
+    return _SOLVER
 
-# Backward compatibility function
 def solve_word_puzzle(image_path):
-    """Backward compatibility wrapper"""
-    solver = WordPuzzleSolver()
-    return solver.solve_puzzle(image_path)
+    """Backward compatibility wrapper reusing one solver across calls"""
+    return get_solver().solve_puzzle(image_path)
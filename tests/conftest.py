@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solver as solver_module
+
+WORDS = frozenset({
+    'ART', 'RAT', 'TAR', 'TAP', 'PAT', 'APT', 'PART', 'TRAP', 'RAPT', 'TARP', 'PRAT',
+    'STAR', 'RATS', 'ARTS', 'TSAR', 'PARTS', 'STRAP', 'SPRAT', 'TRAPS', 'SPORT', 'PORTS',
+    'STOP', 'POTS', 'SPOT', 'TOPS', 'POST', 'OPTS', 'ROSE', 'SORE', 'ORE', 'ROE',
+    'AT', 'TO', 'PARTSEO', 'EXTRA', 'ZOO',
+})
+
+
+@pytest.fixture
+def solver(monkeypatch):
+    """Solver over a small fixed word list, so no test downloads the dictionary"""
+    monkeypatch.setattr(solver_module.WordPuzzleSolver, '_load_dictionary', lambda self: WORDS)
+    instance = solver_module.WordPuzzleSolver()
+    yield instance
+    instance.close()
@@ -0,0 +1,101 @@
+import itertools
+
+import pytest
+
+np = pytest.importorskip('numpy')
+cv2 = pytest.importorskip('cv2')
+
+import solver as solver_module
+from solver import TEMPLATE_MIN_CONFIDENCE, TEMPLATE_MIN_SCORE, glyph_template
+
+
+def render(letter, font=cv2.FONT_HERSHEY_SIMPLEX, scale=2.0):
+    """White-on-black letter crop padded with a 10 px border, as the strategies pass it"""
+    img = np.zeros((100, 100), np.uint8)
+    cv2.putText(img, letter, (10, 75), font, scale, 255, 4)
+    x, y, w, h = cv2.boundingRect(img)
+    return cv2.copyMakeBorder(img[y:y+h, x:x+w], 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=0)
+
+
+def test_blank_glyph_has_no_template():
+    assert glyph_template(np.zeros((30, 20), np.uint8)) is None
+
+
+def test_solid_glyph_has_no_template():
+    assert glyph_template(np.full((30, 20), 255, np.uint8)) is None
+
+
+@pytest.mark.parametrize('font', [cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_DUPLEX,
+                                  cv2.FONT_HERSHEY_TRIPLEX])
+def test_padded_lookalikes_stay_below_threshold(font):
+    templates = {letter: glyph_template(render(letter, font)) for letter in solver_module.LETTER_WHITELIST}
+    for a, b in itertools.combinations(templates, 2):
+        (aspect_a, vector_a), (aspect_b, vector_b) = templates[a], templates[b]
+        if aspect_a == aspect_b:
+            assert float(vector_a @ vector_b) < TEMPLATE_MIN_SCORE, (a, b)
+
+
+def test_same_letter_matches_across_sizes():
+    (_, small), (_, large) = glyph_template(render('O', scale=2.0)), glyph_template(render('O', scale=2.1))
+    assert float(small @ large) >= TEMPLATE_MIN_SCORE
+
+
+def test_lookalike_template_is_refused(solver):
+    aspect, vector = glyph_template(render('O'))
+    solver._learn_template(aspect, vector, 'O')
+    assert solver._template_letters == ['O']
+
+    # The same glyph read as another letter makes both unusable
+    solver._learn_template(aspect, vector, 'D')
+    assert solver._template_letters == []
+    assert solver._templates.shape[0] == 0
+
+
+def test_duplicate_template_is_not_stored_twice(solver):
+    aspect, vector = glyph_template(render('O'))
+    solver._learn_template(aspect, vector, 'O')
+    solver._learn_template(aspect, vector, 'O')
+    assert solver._template_letters == ['O']
+
+
+def test_ambiguous_match_is_left_to_ocr(solver):
+    aspect, vector = glyph_template(render('O'))
+    with solver._ocr_cache_lock:
+        solver._templates = np.stack([vector, vector])
+        solver._template_aspects = np.array([aspect, aspect], np.uint8)
+        solver._template_letters = ['O', 'D']
+
+    texts = [None]
+    solver._match_templates([0], {0: (aspect, vector)}, texts)
+    assert texts == [None]
+
+
+def ocr_with(solver, monkeypatch, reads):
+    """Run _ocr_letters with Tesseract replaced by fixed (text, confidence) reads"""
+    calls = []
+
+    def fake_mosaic(rois):
+        calls.append(len(rois))
+        return [reads.pop(0) for _ in rois]
+
+    monkeypatch.setattr(solver, '_ocr_letters_mosaic', fake_mosaic)
+    monkeypatch.setattr(type(solver), 'tess', property(lambda self: None))
+    return calls
+
+
+def test_low_confidence_read_is_not_learned(solver, monkeypatch):
+    ocr_with(solver, monkeypatch, [('O', TEMPLATE_MIN_CONFIDENCE - 1)])
+    assert solver._ocr_letters([render('O')]) == ['O']
+    assert solver._template_letters == []
+
+
+def test_confident_read_answers_later_crops(solver, monkeypatch):
+    calls = ocr_with(solver, monkeypatch, [('O', TEMPLATE_MIN_CONFIDENCE), ('D', TEMPLATE_MIN_CONFIDENCE)])
+    assert solver._ocr_letters([render('O')]) == ['O']
+    assert solver._template_letters == ['O']
+
+    # A resized O matches the template without OCR; a D still goes to Tesseract
+    assert solver._ocr_letters([render('O', scale=2.1)]) == ['O']
+    assert calls == [1]
+    assert solver._ocr_letters([render('D')]) == ['D']
+    assert calls == [1, 1]
@@ -0,0 +1,151 @@
+import importlib
+import itertools
+import json
+from collections import Counter
+
+import pytest
+
+import solver as solver_module
+from solver import MAX_RESULTS, MAX_WORD_LENGTH, MIN_WORD_LENGTH
+
+from conftest import WORDS
+
+
+def brute_force_words(letters):
+    """Every dictionary word whose letters are a sub-multiset of the board"""
+    board = Counter(letters)
+    return {word for word in WORDS
+            if MIN_WORD_LENGTH <= len(word) <= min(len(letters), MAX_WORD_LENGTH)
+            and not Counter(word) - board}
+
+
+@pytest.mark.parametrize('letters', ['PARTSEO', 'PARTS', 'TRAP', 'AAPRTT', 'OOZ', 'XYZ', 'A', ''])
+def test_dawg_walk_matches_brute_force(solver, letters):
+    keys = solver._candidate_keys(list(letters))
+    assert len(keys) == len(set(keys))
+    assert {word for key in keys for word in solver.anagrams[key]} == brute_force_words(letters)
+
+
+def test_every_sub_multiset_is_walked(solver):
+    board = list('PARTSEO')
+    keys = set(solver._candidate_keys(board))
+    expected = {''.join(sorted(combo))
+                for length in range(MIN_WORD_LENGTH, len(board) + 1)
+                for combo in itertools.combinations(board, length)} & set(solver.anagrams)
+    assert keys == expected
+
+
+def test_top_words_longest_first_then_alphabetical(solver):
+    words = solver._top_words(list('PARTSEO'))
+    assert list(words) == sorted(words, key=lambda word: (-len(word), word))
+    assert words[0] == 'PARTSEO'
+
+
+def test_top_words_capped_at_max_results(solver):
+    words = solver._top_words(list('PARTSEO'))
+    assert len(brute_force_words('PARTSEO')) > MAX_RESULTS
+    assert len(words) == MAX_RESULTS
+    # The cap drops the shortest words, never a longer one
+    dropped = brute_force_words('PARTSEO') - set(words)
+    assert max(map(len, dropped)) <= min(map(len, words))
+
+
+def test_top_words_cached_by_letter_multiset(solver, monkeypatch):
+    words = solver._top_words(list('TRAP'))
+    monkeypatch.setattr(solver, '_candidate_keys', lambda letters: pytest.fail('walked again'))
+    assert solver._top_words(list('PART')) is words
+
+
+def test_word_cache_evicts_least_recently_used(solver, monkeypatch):
+    monkeypatch.setattr(solver_module, 'WORD_CACHE_SIZE', 2)
+    solver._top_words(list('ART'))
+    solver._top_words(list('STOP'))
+    solver._top_words(list('ART'))
+    solver._top_words(list('ROSE'))
+    assert list(solver._word_cache) == ['ART', 'EORS']
+
+
+def test_result_cache_skips_empty_and_evicts(solver, monkeypatch):
+    monkeypatch.setattr(solver_module, 'RESULT_CACHE_SIZE', 2)
+    monkeypatch.setattr(solver, '_decode_image', lambda data: data)
+    solved = []
+
+    def solve(data):
+        solved.append(data)
+        return {"swipes": [] if data == b'empty' else [{'word': data.decode()}]}
+    monkeypatch.setattr(solver, 'solve_puzzle_array', solve)
+
+    # Empty results are not cached, so the next upload runs the solver again
+    solver.solve_puzzle_bytes(b'empty')
+    solver.solve_puzzle_bytes(b'empty')
+    assert solved == [b'empty', b'empty']
+    assert not solver._result_cache
+
+    first = solver.solve_puzzle_bytes(b'a')
+    assert solver.solve_puzzle_bytes(b'a') is first
+    solver.solve_puzzle_bytes(b'b')
+    solver.solve_puzzle_bytes(b'a')
+    solver.solve_puzzle_bytes(b'c')
+    assert solved == [b'empty', b'empty', b'a', b'b', b'c']
+    # b was least recently used when c arrived
+    solver.solve_puzzle_bytes(b'b')
+    assert solved[-1] == b'b'
+    assert len(solver._result_cache) == 2
+
+
+def test_ocr_cache_evicts_least_recently_used(solver, monkeypatch):
+    np = pytest.importorskip('numpy')
+    monkeypatch.setattr(solver_module, 'OCR_CACHE_SIZE', 2)
+    monkeypatch.setattr(type(solver), 'tess', property(lambda self: None))
+    monkeypatch.setattr(solver, '_ocr_letters_mosaic', lambda rois: [('', 0)] * len(rois))
+    # Different aspect ratios give different glyph keys
+    rois = [np.full((4, width), 255, np.uint8) for width in (2, 4, 8)]
+
+    solver._ocr_letters([rois[0]])
+    solver._ocr_letters([rois[1]])
+    solver._ocr_letters([rois[0]])
+    solver._ocr_letters([rois[2]])
+    assert list(solver._ocr_cache) == [solver_module.glyph_hash(rois[0]), solver_module.glyph_hash(rois[2])]
+
+
+def test_swipes_follow_board_slots(solver):
+    letters_data = [{'x': i * 10, 'y': 5, 'letter': letter} for i, letter in enumerate('TRAP')]
+    swipes = {swipe['word']: swipe for swipe in solver._generate_word_swipes(letters_data)}
+    assert set(swipes) == brute_force_words('TRAP')
+    assert swipes['PART']['path'] == [{'x': 30, 'y': 5, 'letter': 'P'}, {'x': 20, 'y': 5, 'letter': 'A'},
+                                      {'x': 10, 'y': 5, 'letter': 'R'}, {'x': 0, 'y': 5, 'letter': 'T'}]
+    assert swipes['PART']['score'] == 40
+
+
+@pytest.mark.parametrize('module', ['app', 'main'])
+def test_orjson_provider_matches_default(solver, monkeypatch, module):
+    pytest.importorskip('flask')
+    pytest.importorskip('orjson')
+    monkeypatch.setattr(solver_module, '_SOLVER', solver)
+    app_module = importlib.import_module(module)
+    assert isinstance(app_module.app.json, app_module.OrjsonProvider)
+
+    letters_data = [{'x': i * 10, 'y': 5, 'letter': letter} for i, letter in enumerate('PARTSEO')]
+    payload = {'success': True, 'swipes': solver._generate_word_swipes(letters_data),
+               'message': 'Found 20 possible words', 'ratio': 0.5, 'none': None}
+    default = super(app_module.OrjsonProvider, app_module.app.json).dumps(payload)
+    assert json.loads(app_module.app.json.dumps(payload)) == json.loads(default)
+
+    with app_module.app.test_client() as client:
+        response = client.get('/health')
+    assert response.get_json() == {'status': 'healthy', 'dictionary_size': len(WORDS)}
+
+
+@pytest.mark.parametrize('wheel, expected', [([1, 2, 3], [1, 2, 3]), ([], ['grid'] * 3)])
+def test_detection_prefers_wheel_over_speculated_grid(solver, monkeypatch, wheel, expected):
+    np = pytest.importorskip('numpy')
+    pytest.importorskip('cv2')
+    monkeypatch.setattr(solver, '_detect_circular_wheel', lambda img, gray, scale: wheel)
+    monkeypatch.setattr(solver, '_detect_grid_layout', lambda img, gray, scale: ['grid'] * 3)
+    monkeypatch.setattr(solver, '_detect_letters_fallback', lambda img, gray, scale: pytest.fail('fallback ran'))
+    img = np.zeros((10, 10, 3), np.uint8)
+    assert solver._detect_letters_scaled(img, 1.0) == expected
+
+    # The solver keeps working after close() by starting a fresh pool
+    solver.close()
+    assert solver._detect_letters_scaled(img, 1.0) == expected